@@ -1,8 +1,16 @@
 import functools
+import os
 import warnings
 from collections.abc import Callable
 from typing import Any
 
+_EXPERIMENTAL_DOCS_WARNING = "**Warning: This function is experimental and may change in future versions**"
+_DEPRECATED_DOCS_WARNING = "**Warning: This function is deprecated and will be removed in the next minor release**"
+
+# The 4-space prefix matches the indentation of the body of function docstrings
+_EXPERIMENTAL_DOCS_PREFIX = f"{_EXPERIMENTAL_DOCS_WARNING}\n\n\n    "
+_DEPRECATED_DOCS_PREFIX = f"{_DEPRECATED_DOCS_WARNING}\n\n\n    "
+
 
 def is_parsed(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator function that marks a function as parsed by adding the `_is_parsed` attribute"""
@@ -13,21 +21,27 @@ def is_parsed(func: Callable[..., Any]) -> Callable[..., Any]:
 
 def experimental_docs(func):
     """Decorator to mark a function as experimental in the docstring."""
-    func.__doc__ = f"""**Warning: This function is experimental and may change in future versions**\n\n
-    {func.__doc__ or ""}"""
+    func.__doc__ = f"{_EXPERIMENTAL_DOCS_PREFIX}{func.__doc__}" if func.__doc__ else _EXPERIMENTAL_DOCS_WARNING
     return func
 
 
 def experimental_log(func):
-    """Decorator to mark a function as experimental with a warning log."""
+    """Decorator to mark a function as experimental with a warning log.
+
+    The warning is only emitted on the first call of the decorated function.
+    """
+    warned = False
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        warnings.warn(
-            f"Function {func.__name__} is experimental and may change in future versions.",
-            category=UserWarning,
-            stacklevel=2,
-        )
+        nonlocal warned
+        if not warned:
+            warnings.warn(
+                f"Function {func.__name__} is experimental and may change in future versions.",
+                category=UserWarning,
+                stacklevel=2,
+            )
+            warned = True
         return func(*args, **kwargs)
 
     return wrapper
@@ -35,8 +49,7 @@ def experimental_log(func):
 
 def deprecated_docs(func):
     """Decorator to mark a function as deprecated in the docstring."""
-    func.__doc__ = f"""**Warning: This function is deprecated and will be removed in the next minor release**\n\n
-    {func.__doc__ or ""}"""
+    func.__doc__ = f"{_DEPRECATED_DOCS_PREFIX}{func.__doc__}" if func.__doc__ else _DEPRECATED_DOCS_WARNING
     return func
 
 
@@ -73,3 +86,32 @@ def deprecated_log(message=None):
         return decorator(func)
 
     return decorator
+
+
+def file_cache(maxsize: int = 128):
+    """Decorator to cache the result of a function that reads a file, given as its only argument
+
+    Results are cached per absolute file path and modification time of the file. The cache is
+    invalidated when the file changes on disk and the same relative path in different working
+    directories does not share a cache entry. Callers must not modify the cached results.
+
+    Parameters
+    ----------
+    maxsize
+        Maximal number of cached results (see :func:`functools.lru_cache`)
+    """
+
+    def decorator(func):
+        # The modification time is only part of the cache key
+        @functools.lru_cache(maxsize=maxsize)
+        def cached_func(path: str, mtime: float):
+            return func(path)
+
+        @functools.wraps(func)
+        def wrapper(path):
+            path = os.path.abspath(path)
+            return cached_func(path, os.path.getmtime(path))
+
+        return wrapper
+
+    return decorator
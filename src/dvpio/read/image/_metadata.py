@@ -1,25 +1,67 @@
 from abc import ABC, abstractmethod
+from copy import deepcopy
+from functools import cached_property
 from typing import Any, ClassVar, Literal
 from warnings import warn
 
 import openslide
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr, model_validator
 from pylibCZIrw.czi import open_czi
 
-from dvpio._utils import is_parsed
+from dvpio._utils import file_cache, is_parsed
 
 
 def _get_value_from_nested_dict(nested_dict: dict, keys: list, default_return_value: Any = None) -> Any:
-    """Get a specific value from a nested dictionary"""
+    """Get a specific value from a nested dictionary
+
+    Returns `default_return_value` as soon as an intermediate key is missing or `None`
+    (empty elements in parsed XML)
+    """
+    if not isinstance(nested_dict, dict):
+        raise ValueError(f"Nested dict is not expected dict but {type(nested_dict)}")
+
     for key in keys[:-1]:
+        nested_dict = nested_dict.get(key)
+        if nested_dict is None:
+            return default_return_value
         if not isinstance(nested_dict, dict):
             raise ValueError(f"Returned type of key {key} in nested dict is not expected dict but {type(nested_dict)}")
-        nested_dict = nested_dict.get(key, {})
 
     return nested_dict.get(keys[-1], default_return_value)
 
 
+def _as_list(value: dict | list | None) -> list:
+    """Represent repeated XML elements consistently as list
+
+    A single occurrence of a repeated element is parsed to a dict instead of a list of dicts.
+    """
+    if value is None:
+        return []
+    if isinstance(value, dict):
+        return [value]
+    return value
+
+
+@file_cache(maxsize=64)
+def _read_czi_metadata(path: str) -> dict[str, Any]:
+    """Read the raw metadata of a CZI file as nested dictionary of the XML metadata"""
+    with open_czi(path) as czi:
+        return czi.metadata
+
+
+def _is_parsed_property(attribute: Any) -> bool:
+    """Whether a class attribute is a (cached) property whose getter is marked with the `_is_parsed` attribute"""
+    if isinstance(attribute, property):
+        return getattr(attribute.fget, "_is_parsed", False)
+    if isinstance(attribute, cached_property):
+        return getattr(attribute.func, "_is_parsed", False)
+    return False
+
+
 class ImageMetadata(BaseModel, ABC):
+    # Metadata is not modified after parsing, which allows to cache all derived fields
+    model_config = ConfigDict(frozen=True)
+
     metadata: dict[str, dict | list | str]
 
     @property
@@ -66,17 +108,22 @@ class ImageMetadata(BaseModel, ABC):
 
     @property
     def parsed_properties(self) -> dict[str, Any]:
-        """Return a dictionary of all parsed metadata fields marked with the `_is_parsed` attribute"""
+        """Return a dictionary of all parsed metadata fields marked with the `_is_parsed` attribute
+
+        The `image_type` is always included, as subclasses may define it as constant class variable.
+        """
         return {
-            attr: getattr(self, attr)
-            for attr in dir(self.__class__)
-            if isinstance(getattr(self.__class__, attr), property)
-            and getattr(getattr(self.__class__, attr).fget, "_is_parsed", False)
+            "image_type": self.image_type,
+            **{
+                attr: getattr(self, attr)
+                for attr in dir(self.__class__)
+                if _is_parsed_property(getattr(self.__class__, attr))
+            },
         }
 
     @classmethod
     @abstractmethod
-    def from_file(cls, path: str) -> BaseModel:
+    def from_file(cls, path: str) -> "ImageMetadata":
         """Parse metadata from file path
 
         Parameters
@@ -94,39 +141,50 @@ class ImageMetadata(BaseModel, ABC):
 class CZIImageMetadata(ImageMetadata):
     metadata: dict[str, Any]
 
-    # *_PATH keys in nested dict that lead to the metadata field
-    _CHANNEL_INFO_PATH: ClassVar = (
-        "ImageDocument",
-        "Metadata",
-        "Information",
-        "Image",
-        "Dimensions",
-        "Channels",
-        "Channel",
-    )
-    _MPP_PATH: ClassVar = ("ImageDocument", "Metadata", "Scaling", "Items", "Distance")
-    _OBJECTIVE_NAME_PATH: ClassVar = ("ImageDocument", "Metadata", "Scaling", "AutoScaling", "ObjectiveName")
-    _OBJECTIVE_NOMINAL_MAGNIFICATION_PATH: ClassVar = (
-        "ImageDocument",
-        "Metadata",
-        "Information",
-        "Instrument",
-        "Objectives",
-        "Objective",
-    )
+    image_type: ClassVar[str] = "czi"
 
-    @property
-    @is_parsed
-    def image_type(self) -> str:
-        return "czi"
+    # Keys in nested dict that lead to the `Metadata` section of the CZI document
+    _METADATA_PATH: ClassVar = ("ImageDocument", "Metadata")
+
+    # *_PATH keys in the `Information` section that lead to the metadata field
+    _CHANNEL_INFO_PATH: ClassVar = ("Image", "Dimensions", "Channels", "Channel")
+    _OBJECTIVES_PATH: ClassVar = ("Instrument", "Objectives", "Objective")
+
+    # *_PATH keys in the `Scaling` section that lead to the metadata field
+    _MPP_PATH: ClassVar = ("Items", "Distance")
+    _OBJECTIVE_NAME_PATH: ClassVar = ("AutoScaling", "ObjectiveName")
+
+    _information: dict[str, Any] = PrivateAttr(default_factory=dict)
+    _scaling: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    # CZI represents the `Channel` metadata field as list of dicts. The dict minimally
+    # contains an `@ID` and a `PixelType` key, but may also contain a `Name` key.
+    _channel_info: list[dict[str, str]] = PrivateAttr(default_factory=list)
+    # Metadata on all available objectives, keyed by objective name (`@Name`)
+    _objectives_by_name: dict[str | None, dict[str, str]] = PrivateAttr(default_factory=dict)
 
-    def _parse_channel_id(self, channel_name: str) -> int:
-        """Parse CZI channel id representation to channel index"""
-        if channel_name is None:
-            return
-        return int(channel_name.replace("Channel:", ""))
+    @model_validator(mode="after")
+    def _resolve_metadata_sections(self) -> "CZIImageMetadata":
+        """Resolve the `Information` and `Scaling` sections of the metadata once
 
-    def _parse_mpp_dim(self, mpp: list[dict[str, str]], dimension: str) -> float | None:
+        All parsed fields are located in one of the two sections, which spares
+        every field from walking the full nested document. Repeated elements
+        (channels, objectives) are normalized to lists.
+        """
+        # Empty XML elements are represented as None
+        metadata = _get_value_from_nested_dict(self.metadata, self._METADATA_PATH) or {}
+        self._information = metadata.get("Information") or {}
+        self._scaling = metadata.get("Scaling") or {}
+
+        self._channel_info = _as_list(_get_value_from_nested_dict(self._information, self._CHANNEL_INFO_PATH))
+        # Later entries take precedence for duplicated objective names
+        self._objectives_by_name = {
+            objective.get("@Name"): objective
+            for objective in _as_list(_get_value_from_nested_dict(self._information, self._OBJECTIVES_PATH))
+        }
+        return self
+
+    def _parse_mpp_dim(self, dimension: str) -> float | None:
         """Parse the pixel resolution entry in CZI metadata
 
         Note
@@ -134,30 +192,11 @@ class CZIImageMetadata(ImageMetadata):
         Per dimension, the resolution is stored as dict with the keys @Id (X/Y/Z),
         and optional `Value` key (resolution as float in meters per pixel).
         """
-        entry = next((e for e in mpp if e.get("@Id") == dimension), {})
-        mpp_dim = entry.get("Value", None)
+        mpp_dim = self._mpp.get(dimension, {}).get("Value")
 
         return float(mpp_dim) if mpp_dim else None
 
-    @property
-    def _channel_info(self) -> list[dict[str, str]]:
-        """Obtain channel metadata from CZI metadata file
-
-        Notes
-        -----
-        CZI represents strings in the `Channel` metadata field as list of dicts.
-        The dict minimally contains an `@ID` and a `PixelType` key, but
-        may also contain a `Name` key.
-        """
-        channels = _get_value_from_nested_dict(self.metadata, self._CHANNEL_INFO_PATH, default_return_value=[])
-
-        # For a single channel, a dict is returned
-        if isinstance(channels, dict):
-            channels = [channels]
-
-        return channels
-
-    @property
+    @cached_property
     @is_parsed
     def channel_id(self) -> list[int]:
         """Parse channel metadata to list of channel ids
@@ -167,54 +206,63 @@ class CZIImageMetadata(ImageMetadata):
         Per channel, IDs are stored under the key `@Id` in the form `Channel:<channel id>`
         in the channel metadata
         """
-        return [self._parse_channel_id(channel.get("@Id")) for channel in self._channel_info]
+        return [
+            int(channel_id.removeprefix("Channel:")) if (channel_id := channel.get("@Id")) is not None else None
+            for channel in self._channel_info
+        ]
 
-    @property
+    @cached_property
     @is_parsed
     def channel_names(self) -> list[str]:
-        """Parse channel metadata to list of channel ids
+        """Parse channel metadata to list of channel names
 
         Returns
         -------
         List of channel names
-            If no channel name is given, falls back to returning index of channel as string
+            If no or an empty channel name is given, falls back to returning index of channel as string
 
         Notes
         -----
         Per channel, names are stored under the key `@Name` as str
         in the channel metadata
         """
-        return [channel.get("@Name", str(idx)) for idx, channel in enumerate(self._channel_info)]
+        return [channel.get("@Name") or str(idx) for idx, channel in enumerate(self._channel_info)]
 
-    @property
+    @cached_property
     def _mpp(self) -> dict[str, dict[str, str]]:
         """Parse pixel resolution from slide image
 
+        Returns
+        -------
+        Pixel resolution entries, keyed by their dimension (`@Id`)
+
         Note
         ----
         Pixel resolution is stored in `Distance` field and always specified in meters per pixel
         """
-        return _get_value_from_nested_dict(self.metadata, self._MPP_PATH, [])
+        distances = _as_list(_get_value_from_nested_dict(self._scaling, self._MPP_PATH))
 
-    @property
+        return {entry["@Id"]: entry for entry in distances if "@Id" in entry}
+
+    @cached_property
     @is_parsed
     def mpp_x(self) -> float | None:
         """Return resolution in X dimension in [meters per pixel]"""
-        return self._parse_mpp_dim(self._mpp, dimension="X")
+        return self._parse_mpp_dim(dimension="X")
 
-    @property
+    @cached_property
     @is_parsed
     def mpp_y(self) -> float | None:
         """Resolution in Y dimension in [meters per pixel]"""
-        return self._parse_mpp_dim(self._mpp, dimension="Y")
+        return self._parse_mpp_dim(dimension="Y")
 
-    @property
+    @cached_property
     @is_parsed
     def mpp_z(self) -> float | None:
         """Resolution in Z dimension in [meters per pixel]"""
-        return self._parse_mpp_dim(self._mpp, dimension="Z")
+        return self._parse_mpp_dim(dimension="Z")
 
-    @property
+    @cached_property
     def objective_name(self) -> str | None:
         """Utilized objective name. Required to infer objective_nominal_magnification
 
@@ -224,10 +272,10 @@ class CZIImageMetadata(ImageMetadata):
         this represents the currently utilized objective
         """
         return _get_value_from_nested_dict(
-            nested_dict=self.metadata, keys=self._OBJECTIVE_NAME_PATH, default_return_value=None
+            nested_dict=self._scaling, keys=self._OBJECTIVE_NAME_PATH, default_return_value=None
         )
 
-    @property
+    @cached_property
     @is_parsed
     def objective_nominal_magnification(self) -> float | None:
         """Utilized objective_nominal_magnification
@@ -238,24 +286,21 @@ class CZIImageMetadata(ImageMetadata):
         from the metadata on all available Objectives. The objective_nominal_magnification of an objective
         is given as `NominalMagnification` field.
         """
-        objectives = _get_value_from_nested_dict(
-            self.metadata, keys=self._OBJECTIVE_NOMINAL_MAGNIFICATION_PATH, default_return_value=[]
-        )
-
-        if isinstance(objectives, dict):
-            objectives = [objectives]
-        objective_nominal_magnification = None
-        for objective in objectives:
-            if objective.get("@Name") == self.objective_name:
-                objective_nominal_magnification = objective.get("NominalMagnification")
+        objective = self._objectives_by_name.get(self.objective_name, {})
+        objective_nominal_magnification = objective.get("NominalMagnification")
         return float(objective_nominal_magnification) if objective_nominal_magnification else None
 
     @classmethod
-    def from_file(cls, path: str) -> BaseModel:
-        with open_czi(path) as czi:
-            metadata = czi.metadata
+    def from_file(cls, path: str) -> "CZIImageMetadata":
+        """Parse metadata from CZI file path
 
-        return cls(metadata=metadata)
+        Note
+        ----
+        The raw metadata is cached per file path and modification time. Repeated calls on
+        an unchanged file do not re-read the file. Every call receives its own copy of the
+        cached metadata, i.e. modifications do not affect later calls.
+        """
+        return cls(metadata=deepcopy(_read_czi_metadata(path)))
 
 
 class OpenslideImageMetadata(ImageMetadata):
@@ -270,13 +315,13 @@ class OpenslideImageMetadata(ImageMetadata):
     _CHANNEL_IDS: ClassVar[list[int]] = [0, 1, 2, 3]
     _CHANNEL_NAMES: ClassVar[list[str]] = ["R", "G", "B", "A"]
 
-    @property
+    @cached_property
     @is_parsed
     def image_type(self) -> str:
         """Indicator of the original image format/microscopy vendor, defaults to openslide if unknown."""
         return self.metadata.get(openslide.PROPERTY_NAME_VENDOR, "openslide")
 
-    @property
+    @cached_property
     @is_parsed
     def objective_nominal_magnification(self) -> float | None:
         magnification = self.metadata.get(openslide.PROPERTY_NAME_OBJECTIVE_POWER)
@@ -296,13 +341,13 @@ class OpenslideImageMetadata(ImageMetadata):
         # https://openslide.org/api/python/#openslide.OpenSlide.read_region
         return self._CHANNEL_NAMES
 
-    @property
+    @cached_property
     @is_parsed
     def mpp_x(self) -> float | None:
         mpp_x = self.metadata.get(openslide.PROPERTY_NAME_MPP_X)
         return self._MICROMETER_TO_METER_CONVERSION * float(mpp_x) if mpp_x is not None else None
 
-    @property
+    @cached_property
     @is_parsed
     def mpp_y(self) -> float | None:
         mpp_y = self.metadata.get(openslide.PROPERTY_NAME_MPP_Y)
@@ -318,8 +363,7 @@ class OpenslideImageMetadata(ImageMetadata):
         return
 
     @classmethod
-    @is_parsed
-    def from_file(cls, path) -> BaseModel:
+    def from_file(cls, path: str) -> "OpenslideImageMetadata":
         slide = openslide.OpenSlide(path)
         return cls(metadata=slide.properties)
 
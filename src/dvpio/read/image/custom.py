@@ -1,11 +1,57 @@
 """Reader for generic images"""
 
+import os
 from collections.abc import Callable, Mapping
 from typing import Any
 
+import dask.array as da
+import numpy as np
+import tifffile
 from dask.array.image import imread as daimread
 from spatialdata.models import Image2DModel
 
+# Chunk size of the spatial dimensions of read images
+_CHUNK_SIZE = 1024
+
+
+def _is_tiled_single_plane_tiff(path: str) -> bool:
+    """Whether the path points to a single TIFF file (and not to a glob pattern) with a tiled 2D image"""
+    if not (os.path.isfile(path) and os.path.splitext(path)[1].lower() in (".tif", ".tiff")):
+        return False
+
+    with tifffile.TiffFile(path) as tiff:
+        level = tiff.series[0].levels[0]
+        return level.ndim == 2 and level.keyframe.is_tiled
+
+
+def _read_tiff_block(path: str, block_info: dict | None = None) -> np.ndarray:
+    """Read the region of a dask block from the highest resolution level of a TIFF file
+
+    The file is opened and closed within the call, i.e. no file handle is kept by the dask graph.
+    """
+    selection = tuple(slice(start, stop) for start, stop in block_info[None]["array-location"])
+    return tifffile.imread(path, selection=selection, level=0)
+
+
+def _read_tiff(path: str) -> da.Array:
+    """Read the highest resolution level of a tiled TIFF file to a chunked dask array
+
+    Every chunk is read independently, i.e. chunks are loaded in parallel. Chunks are aligned
+    to the tiles of the file so that every tile is decoded once. Like
+    :func:`dask.array.image.imread`, the returned array has a leading dimension
+    for the number of files.
+    """
+    with tifffile.TiffFile(path) as tiff:
+        level = tiff.series[0].levels[0]
+        shape, dtype = level.shape, level.dtype
+        tile_shape = (level.keyframe.tilelength, level.keyframe.tilewidth)
+
+    # Largest multiple of the tile size that does not exceed the chunk size
+    chunks = tuple(max(_CHUNK_SIZE // tile, 1) * tile for tile in tile_shape)
+
+    img = da.map_blocks(_read_tiff_block, path, chunks=da.core.normalize_chunks(chunks, shape), dtype=dtype)
+    return img[None]
+
 
 def read_custom(
     path: str,
@@ -17,7 +63,8 @@ def read_custom(
     This function might not be performant for large images.
 
     Uses the :func:`dask.array.image.imread` function to read any image file to dask.
-    Support widely used file types, including `.tiff`.
+    Support widely used file types, including `.tiff`. Tiled single-plane `.tiff` files are read
+    in chunks with :mod:`tifffile` if no custom `imread` function is passed.
 
     Pass a custom reader function to `imread`
 
@@ -29,12 +76,19 @@ def read_custom(
         Custom image reading function. Function should expect a filename string
         return a numpy array (:func:`dask.array.image.imread`)
     **kwargs
-        Keyword arguments passed to :meth:`spatialdata.models.Image2DModel.parse`
+        Keyword arguments passed to :meth:`spatialdata.models.Image2DModel.parse`. If `chunks` is
+        not passed, the image is chunked in tiles of 1024 x 1024 pixels
 
     Returns
     -------
     :class:`spatialdata.models.Image2DModel`
     """
-    img = daimread(path, imread=imread)
+    if imread is None and _is_tiled_single_plane_tiff(path):
+        img = _read_tiff(path)
+    else:
+        img = daimread(path, imread=imread)
+
+    # Split images read by dask imread, which loads every file as a single chunk
+    kwargs.setdefault("chunks", {"y": _CHUNK_SIZE, "x": _CHUNK_SIZE})
 
     return Image2DModel.parse(img, **kwargs)
@@ -48,13 +48,18 @@ def _parse_pandas_index(index: pd.Index | pd.MultiIndex, set_index: str | None =
         DataFrame with index values as columns, optionally with the column specified in `set_index`
         as index.
     """
+    # A single-level index that is set as index again does not need to be expanded to a column
+    if not isinstance(index, pd.MultiIndex) and set_index is not None and set_index == index.name:
+        return pd.DataFrame(index=index, columns=pd.Index([], dtype=object))
+
     df = index.to_frame(index=False)
-    df.index = df.index.astype(str)
     df.columns = df.columns.astype(str)
 
     if set_index is not None:
-        df.set_index(set_index, inplace=True)
+        return df.set_index(set_index)
 
+    # Only cast the range index to string if it is kept, as this dominates the runtime for large indices
+    df.index = df.index.astype(str)
     return df
 
 
@@ -1,8 +1,10 @@
 from typing import Literal
 
 import numpy as np
+import shapely
 from numpy.typing import NDArray
 from skimage.transform import estimate_transform
+from spatialdata.models import PointsModel
 
 
 def compute_transformation(
@@ -45,11 +47,41 @@ def compute_transformation(
     if query_points.shape[0] < 3:
         raise ValueError("At least three points are required to compute the transformation.")
 
+    if transformation_type == "affine" and query_points.shape[0] == 3:
+        affine_matrix = _solve_affine_transformation(query_points, reference_points)
+        if affine_matrix is not None:
+            return affine_matrix
+
     affine_matrix = estimate_transform(ttype=transformation_type, src=query_points, dst=reference_points).params
 
     return affine_matrix.T
 
 
+def _solve_affine_transformation(
+    query_points: NDArray[np.float64], reference_points: NDArray[np.float64]
+) -> NDArray[np.float64] | None:
+    """Solve for the affine transformation that exactly maps three query points to three reference points
+
+    With three point pairs, the affine transformation is fully determined by the square system
+    of homogeneous query coordinates, which is solved directly instead of via a least-squares fit.
+
+    Returns
+    -------
+    (3, 3) affine transformation matrix or `None` if the query points are collinear.
+    """
+    query_points_homogeneous = np.hstack([query_points, np.ones(shape=(query_points.shape[0], 1))])
+
+    try:
+        solution = np.linalg.solve(query_points_homogeneous, reference_points)
+    except np.linalg.LinAlgError:
+        return None
+
+    affine_matrix = np.zeros(shape=(3, 3))
+    affine_matrix[:, :2] = solution
+    affine_matrix[2, 2] = 1
+    return affine_matrix
+
+
 def apply_transformation(
     shape: NDArray[np.float64],
     affine_transformation: NDArray[np.float64],
@@ -71,9 +103,41 @@ def apply_transformation(
     NDArray[np.float64]
         Shape (N, 2) after affine transformation.
     """
-    # Extend shape with ones
-    shape_mod = np.hstack([shape, np.ones(shape=(shape.shape[0], 1))])
-    # Apply affine transformation
-    shape_transformed = shape_mod @ affine_transformation
-    # Reuturn shape without padded ones
-    return shape_transformed[:, :-1]
+    # Apply linear part and translation of the affine transformation separately,
+    # which avoids padding the shape with ones (homogeneous coordinates)
+    # The translation is added in place to the result of the matrix product, which saves one temporary array
+    transformed_shape = shape @ affine_transformation[:2, :2]
+    transformed_shape += affine_transformation[2, :2]
+    return transformed_shape
+
+
+def transform_geometries(
+    geometries: NDArray[np.object_],
+    affine_transformation: NDArray[np.float64],
+) -> NDArray[np.object_]:
+    """Apply an affine transformation to an array of shapely geometries
+
+    Parameters
+    ----------
+    geometries
+        Array of shapely geometries
+    affine_transformation
+        Affine transformation applied to the geometries (see :func:`apply_transformation`)
+
+    Returns
+    -------
+    NDArray[np.object_]
+        Array of transformed shapely geometries
+    """
+    # Coordinates of all geometries are passed as single (N, 2) array to the affine transformation
+    return shapely.transform(
+        geometries, transformation=lambda coordinates: apply_transformation(coordinates, affine_transformation)
+    )
+
+
+def points_to_numpy(points: PointsModel) -> NDArray[np.float64]:
+    """Get `x`/`y` coordinates of points as (N, 2) array
+
+    Computing the small dataframe directly avoids building a dask array with unknown chunk sizes
+    """
+    return points[["x", "y"]].compute().to_numpy()
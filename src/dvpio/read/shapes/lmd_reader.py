@@ -1,12 +1,46 @@
 from typing import Literal
 
+import geopandas as gpd
 import lmd.lib as pylmd
 import numpy as np
 import shapely
 from spatialdata.models import PointsModel, ShapesModel
 from spatialdata.transformations import Affine, set_transformation
 
-from .geometry import apply_transformation, compute_transformation
+from dvpio._utils import file_cache
+
+from .geometry import compute_transformation, points_to_numpy, transform_geometries
+
+# Affine transformation that switches x/y coordinates (mirror at main diagonal)
+_SWITCH_ORIENTATION_TRANSFORMATION = np.array([[0, 1, 0], [1, 0, 0], [0, 0, 1]])
+
+
+def _collection_to_geopandas(collection: pylmd.Collection) -> gpd.GeoDataFrame:
+    """Represent shapes of a pyLMD collection as GeoDataFrame with `name` and `well` columns
+
+    Equivalent to :meth:`lmd.lib.Collection.to_geopandas`, but creates all polygons
+    with the vectorized shapely constructors instead of one :class:`shapely.Polygon` per shape.
+    """
+    shapes = collection.shapes
+    points = [shape.points for shape in shapes]
+
+    if len(points) > 0:
+        shape_indices = np.repeat(np.arange(len(points)), [len(shape_points) for shape_points in points])
+        geometry = shapely.polygons(shapely.linearrings(np.concatenate(points), indices=shape_indices))
+    else:
+        geometry = []
+
+    return gpd.GeoDataFrame(
+        data={"name": [shape.name for shape in shapes], "well": [shape.well for shape in shapes]}, geometry=geometry
+    )
+
+
+@file_cache(maxsize=4)
+def _read_lmd_file(path: str) -> tuple[gpd.GeoDataFrame, np.ndarray]:
+    """Read shapes and (N, 2) calibration points of an LMD file with pyLMD"""
+    lmd_shapes = pylmd.Collection()
+    lmd_shapes.load(path)
+    return _collection_to_geopandas(lmd_shapes), np.asarray(lmd_shapes.calibration_points)
 
 
 def transform_shapes(
@@ -16,6 +50,7 @@ def transform_shapes(
     *,
     precision: int | None = None,
     transformation_type: Literal["similarity", "affine", "euclidean"] = "similarity",
+    switch_orientation: bool = False,
 ) -> ShapesModel:
     """Apply coordinate transformation to shapes based on calibration points from a target and a source
 
@@ -44,6 +79,9 @@ def transform_shapes(
             Only translation and rotation are allowed
     precision
         Rounding digit of affine transformation matrix. Small values (~6) might be necessary for numerical stability of shape transformations.
+    switch_orientation
+        If True, additionally switch the x/y coordinates of the transformed shapes (mirror at the main diagonal).
+        The switch is part of the affine transformation, i.e. it is also reverted by the `to_lmd` transformation.
 
     Returns
     -------
@@ -60,15 +98,51 @@ def transform_shapes(
     ------
     AttributeError
         Checks validity of shapes and calibration points data formats
+    ValueError
+        If there are less than 3 calibration points or the number of source and target calibration points differs
     """
     ShapesModel.validate(shapes)
     PointsModel.validate(calibration_points_source)
     PointsModel.validate(calibration_points_target)
 
-    # Convert to numpy arrays
-    calibration_points_source = calibration_points_source[["x", "y"]].to_dask_array().compute()
-    calibration_points_target = calibration_points_target[["x", "y"]].to_dask_array().compute()
+    # Materialize the small point sets once, the count checks then run on the arrays
+    calibration_points_target = points_to_numpy(calibration_points_target)
+    calibration_points_source = points_to_numpy(calibration_points_source)
+    _validate_calibration_points(calibration_points_target, calibration_points_source)
+
+    return _transform_shapes(
+        shapes,
+        calibration_points_target,
+        calibration_points_source,
+        precision=precision,
+        transformation_type=transformation_type,
+        switch_orientation=switch_orientation,
+    )
 
+
+def _validate_calibration_points(calibration_points_target: np.ndarray, calibration_points_source: np.ndarray) -> None:
+    """Check that matched (N, 2) calibration point arrays suffice to compute a transformation
+
+    Runs before the transformation is estimated
+    """
+    if len(calibration_points_source) < 3:
+        raise ValueError(f"Require at least 3 calibration points, but only received {len(calibration_points_source)}")
+    if len(calibration_points_source) != len(calibration_points_target):
+        raise ValueError(
+            f"Number of target calibration points ({len(calibration_points_target)}) must be equal to number of source calibration points ({len(calibration_points_source)})"
+        )
+
+
+def _transform_shapes(
+    shapes: ShapesModel,
+    calibration_points_target: np.ndarray,
+    calibration_points_source: np.ndarray,
+    *,
+    precision: int | None,
+    transformation_type: Literal["similarity", "affine", "euclidean"],
+    switch_orientation: bool,
+) -> ShapesModel:
+    """Implementation of :func:`transform_shapes` for validated shapes and (N, 2) calibration point arrays"""
     # (Full affine transformation) Compute scaling, rotation+reflection, translation + shearing. In this case, angles are not preserved
     # (Similarity transformation) Constrain the affine transformation to scaling, rotation+reflection, translation. In this case, angles are preserved
     affine_transformation = compute_transformation(
@@ -78,6 +152,9 @@ def transform_shapes(
         transformation_type=transformation_type,
     )
 
+    if switch_orientation:
+        affine_transformation = affine_transformation @ _SWITCH_ORIENTATION_TRANSFORMATION
+
     affine_transformation_inverse = np.linalg.inv(affine_transformation)
 
     # Rounding might be required for numerical stability of shapely transformation
@@ -86,12 +163,7 @@ def transform_shapes(
         affine_transformation_inverse = np.around(affine_transformation_inverse, precision)
 
     # Transform shapes
-    # Iterate through shapes and apply affine transformation
-    transformed_shapes = shapes["geometry"].apply(
-        lambda shape: shapely.transform(
-            shape, transformation=lambda geom: apply_transformation(geom, affine_transformation)
-        )
-    )
+    transformed_shapes = transform_geometries(shapes["geometry"].to_numpy(), affine_transformation)
 
     # Reassign as DataFrame and parse with spatialdata
     transformed_shapes = ShapesModel.parse(shapes.assign(geometry=transformed_shapes))
@@ -156,17 +228,23 @@ def read_lmd(
         - `attrs.transformation`
             - `global` (image coordinates)
             - `to_lmd` Transformation back to leica coordinate system
+
+    Note
+    ----
+    The parsed file is cached per file path and modification time. Repeated calls on
+    an unchanged file do not parse the .xml file again.
     """
     PointsModel.validate(calibration_points_image)
 
     # Load LMD shapes with pyLMD
-    lmd_shapes = pylmd.Collection()
-    lmd_shapes.load(path)
-    shapes = lmd_shapes.to_geopandas("name", "well")
+    shapes, calibration_points_lmd = _read_lmd_file(path)
 
     # Transform to spatialdata models
-    shapes = ShapesModel.parse(shapes)
-    calibration_points_lmd = PointsModel.parse(lmd_shapes.calibration_points)
+    # Copy the cached objects, as they are modified by parsing and returned to the user
+    # Calibration points are only used as coordinate arrays and are not parsed to a PointsModel
+    shapes = ShapesModel.parse(shapes.copy())
+    calibration_points_lmd = calibration_points_lmd.copy()
+    calibration_points_image = points_to_numpy(calibration_points_image)
 
     if len(calibration_points_lmd) < 3:
         raise ValueError(f"Require at least 3 calibration points, but only received {len(calibration_points_lmd)}")
@@ -175,19 +253,13 @@ def read_lmd(
             f"Number of calibration points in image ({len(calibration_points_image)}) must be equal to number of calibration points in LMD file ({len(calibration_points_lmd)})"
         )
 
-    transformed_shapes = transform_shapes(
+    transformed_shapes = _transform_shapes(
         shapes=shapes,
         calibration_points_target=calibration_points_image,
         calibration_points_source=calibration_points_lmd,
         transformation_type=transformation_type,
         precision=precision,
+        switch_orientation=switch_orientation,
     )
 
-    if switch_orientation:
-        # Transformation switches x/y coordinates (mirror at main diagonal)
-        switch_axes = lambda geom: geom @ np.array([[0, 1], [1, 0]])
-        transformed_shapes["geometry"] = transformed_shapes["geometry"].apply(
-            lambda geom: shapely.transform(geom, transformation=switch_axes)
-        )
-
     return transformed_shapes
@@ -1,11 +1,58 @@
 import os
 
+import geopandas as gpd
 import lmd.lib as pylmd
 import numpy as np
 import shapely
 import spatialdata as sd
 
-from dvpio.read.shapes.geometry import apply_transformation
+from dvpio.read.shapes.geometry import apply_transformation, points_to_numpy, transform_geometries
+
+
+def _shapes_from_geopandas(
+    gdf: gpd.GeoDataFrame,
+    name_column: str | None = None,
+    well_column: str | None = None,
+    custom_attribute_columns: str | list[str] | None = None,
+) -> list[pylmd.Shape]:
+    """Create pyLMD shapes from the exterior rings of polygons in a GeoDataFrame
+
+    Equivalent to the shapes created by :meth:`lmd.lib.Collection.load_geopandas`, but extracts the
+    coordinates of all polygons with a single vectorized shapely call instead of iterating over rows.
+
+    Raises
+    ------
+    ValueError
+        If `gdf` contains geometries other than polygons
+    """
+    if custom_attribute_columns is None:
+        custom_attribute_columns = []
+    if isinstance(custom_attribute_columns, str):
+        custom_attribute_columns = [custom_attribute_columns]
+
+    is_polygon = gdf.geometry.geom_type == "Polygon"
+    if not is_polygon.all():
+        raise ValueError(
+            f"Only Polygon geometries can be exported, but rows {gdf.index[~is_polygon].tolist()} contain "
+            f"{gdf.geometry[~is_polygon].geom_type.unique().tolist()} geometries"
+        )
+
+    exteriors = shapely.get_exterior_ring(gdf.geometry.to_numpy())
+    coordinates = shapely.get_coordinates(exteriors)
+    points = np.split(coordinates, np.cumsum(shapely.get_num_coordinates(exteriors))[:-1])
+
+    names = gdf[name_column].tolist() if name_column is not None else [None] * len(gdf)
+    wells = gdf[well_column].tolist() if well_column is not None else [None] * len(gdf)
+    custom_attributes = (
+        gdf[custom_attribute_columns].to_dict("records") if custom_attribute_columns else [{}] * len(gdf)
+    )
+
+    return [
+        pylmd.Shape(points=shape_points, name=name, well=well, **shape_custom_attributes)
+        for shape_points, name, well, shape_custom_attributes in zip(
+            points, names, wells, custom_attributes, strict=True
+        )
+    ]
 
 
 def write_lmd(
@@ -27,9 +74,10 @@ def write_lmd(
     annotation
         Shapes to export with pyLMD
     calibration_points
-        Calibration points in image coordinates
+        Calibration points in image coordinates, i.e. in the same coordinate system as `annotation`
     affine_transformation
-        Optional. Affine transformation to apply to the data to recover Leica coordinate system. If `None`,
+        Optional. Affine transformation to apply to the data to recover Leica coordinate system, as (3, 3) matrix
+        that is applied to (x, y, 1) row vectors. If `None`,
         tries to recover the `to_lmd` coordinate transformation from the `annotation`
         :class:`spatialdata.models.ShapesModel` object
     annotation_name_column
@@ -45,7 +93,7 @@ def write_lmd(
         will become the tag name in the respective shape element. Users must assure themselves that they
         pass valid arguments.
     overwrite
-        Default `True`. Whether to overwrite existing data.
+        Default `True`. Whether to overwrite existing data. If `False`, raises a `ValueError` if `path` exists.
 
     Returns
     -------
@@ -85,6 +133,9 @@ def write_lmd(
     sd.models.ShapesModel.validate(annotation)
     sd.models.PointsModel.validate(calibration_points)
 
+    # Convert calibration points dataframe to (N, 2) array for pylmd
+    calibration_points = points_to_numpy(calibration_points)
+
     if len(calibration_points) < 3:
         raise ValueError(f"There must be at least 3 points, currently only {len(calibration_points)}")
 
@@ -96,32 +147,26 @@ def write_lmd(
     collection.scale = 1
 
     # Transform annotation to leica coordinate system based on transformation
+    # spatialdata transforms column vectors, while points are transformed as row vectors, i.e. transpose the matrix
     if affine_transformation is None:
-        affine_transformation = sd.transformations.get_transformation(
-            annotation, to_coordinate_system="to_lmd"
-        ).to_affine_matrix(("x", "y"), ("x", "y"))
+        affine_transformation = (
+            sd.transformations.get_transformation(annotation, to_coordinate_system="to_lmd")
+            .to_affine_matrix(("x", "y"), ("x", "y"))
+            .T
+        )
 
-    # Convert calibration points dataframe to (N, 2) array for pylmd
-    calibration_points_transformed = apply_transformation(
-        calibration_points[["x", "y"]].to_dask_array().compute(), affine_transformation
-    )
+    calibration_points_transformed = apply_transformation(calibration_points, affine_transformation)
 
-    annotation_transformed = annotation["geometry"].apply(
-        lambda shape: shapely.transform(
-            shape,
-            transformation=lambda geom: apply_transformation(geom, affine_transformation),
-        )
-    )
+    annotation_transformed = transform_geometries(annotation["geometry"].to_numpy(), affine_transformation)
 
     annotation_transformed = annotation.assign(geometry=annotation_transformed)
 
     # Load annotation and optional columns
-    collection.load_geopandas(
+    collection.calibration_points = calibration_points_transformed
+    collection.shapes = _shapes_from_geopandas(
         annotation_transformed,
-        geometry_column="geometry",
         name_column=annotation_name_column,
         well_column=annotation_well_column,
-        calibration_points=calibration_points_transformed,
         custom_attribute_columns=custom_attribute_columns,
     )
 
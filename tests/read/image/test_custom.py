@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 from tifffile import imread as tiffread
+from tifffile import imwrite as tiffwrite
 
 from dvpio.read.image import read_custom
 
@@ -15,3 +17,16 @@ def test_custom(filename: str) -> None:
 
     assert img.shape == img_groundtruth.shape
     assert (img == img_groundtruth).all()
+
+
+@pytest.mark.parametrize(["filename"], [["image.tiff"], ["image*.tiff"]])
+@pytest.mark.parametrize(["tile"], [[None], [(256, 256)]])
+def test_custom_chunked_tiff(tmp_path, filename: str, tile: tuple[int, int] | None) -> None:
+    img_groundtruth = np.random.default_rng(42).integers(0, 255, size=(1500, 1200), dtype=np.uint8)
+    tiffwrite(tmp_path / "image.tiff", img_groundtruth, tile=tile)
+
+    img = read_custom(str(tmp_path / filename), dims=("c", "y", "x"))
+
+    assert img.shape == (1, *img_groundtruth.shape)
+    assert img.data.numblocks == (1, 2, 2)
+    assert (img[0] == img_groundtruth).all()
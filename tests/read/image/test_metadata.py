@@ -1,7 +1,10 @@
+import os
 from typing import Any
 
+import numpy as np
 import pytest
 from pydantic import BaseModel
+from pylibCZIrw import czi as pyczi
 
 from dvpio.read.image._metadata import (
     CZIImageMetadata,
@@ -77,12 +80,17 @@ def nested_dict():
     return nd
 
 
-@pytest.mark.parametrize((["keys", "output"]), [(["A"], []), (["B", "C"], "c"), (["E"], None), (["B", "D"], None)])
+@pytest.mark.parametrize(
+    (["keys", "output"]), [(["A"], []), (["B", "C"], "c"), (["E"], None), (["B", "D"], None), (["E", "F", "G"], None)]
+)
 def test_get_value_from_nested_dict(nested_dict: dict[str, Any], keys: list[str], output: str | None) -> None:
     assert _get_value_from_nested_dict(nested_dict, keys=keys, default_return_value=None) == output
 
 
-@pytest.mark.parametrize((["keys", "default_return_value"]), [("E", []), ("E", {}), (["B", "D"], []), (["B", "D"], {})])
+@pytest.mark.parametrize(
+    (["keys", "default_return_value"]),
+    [("E", []), ("E", {}), (["B", "D"], []), (["B", "D"], {}), (["E", "F", "G"], [])],
+)
 def test_get_value_from_nested_dict_return_value(
     nested_dict: dict[str, Any], keys: list[str], default_return_value: str | None
 ) -> None:
@@ -93,7 +101,14 @@ def test_get_value_from_nested_dict_return_value(
     )
 
 
-@pytest.fixture(params=CZI_GROUND_TRUTH.keys())
+@pytest.mark.parametrize("value", [[], ["a"], "", "a"])
+def test_get_value_from_nested_dict_invalid_type(value: list | str) -> None:
+    """Test that intermediate values that are not dicts raise, irrespective of whether they are empty"""
+    with pytest.raises(ValueError):
+        _get_value_from_nested_dict({"A": value}, keys=["A", "B"])
+
+
+@pytest.fixture(scope="module", params=CZI_GROUND_TRUTH.keys())
 def czi_metadata_parser(request) -> BaseModel:
     path = request.param
     return (CZIImageMetadata.from_file(path), CZI_GROUND_TRUTH[path])
@@ -126,7 +141,68 @@ def test_czi_magnification_parser(czi_metadata_parser):
     assert metadata.objective_nominal_magnification == ground_truth["objective_nominal_magnification"]
 
 
-@pytest.fixture(params=OPENSLIDE_GROUND_TRUTH.keys())
+@pytest.mark.parametrize(
+    ["distance", "mpp"],
+    [
+        # Single `Distance` entry is parsed to a dict
+        ({"@Id": "X", "Value": "1e-7"}, (1e-7, None, None)),
+        # Multiple `Distance` entries are parsed to a list of dicts
+        (
+            [{"@Id": "X", "Value": "1e-7"}, {"@Id": "Y", "Value": "2e-7"}, {"@Id": "Z"}],
+            (1e-7, 2e-7, None),
+        ),
+    ],
+)
+def test_czi_mpp_parser_distance(distance: dict | list[dict], mpp: tuple[float | None, ...]) -> None:
+    metadata = CZIImageMetadata(
+        metadata={"ImageDocument": {"Metadata": {"Scaling": {"Items": {"Distance": distance}}}}}
+    )
+
+    assert (metadata.mpp_x, metadata.mpp_y, metadata.mpp_z) == mpp
+
+
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        {},
+        {"ImageDocument": None},
+        {"ImageDocument": {"Metadata": None}},
+        {"ImageDocument": {"Metadata": {"Information": None, "Scaling": None}}},
+        {"ImageDocument": {"Metadata": {"Information": {"Image": {"Dimensions": {"Channels": None}}}}}},
+    ],
+)
+def test_czi_parser_missing_sections(metadata: dict[str, Any]) -> None:
+    """Missing or empty (`None`) metadata sections result in empty values"""
+    metadata = CZIImageMetadata(metadata=metadata)
+
+    assert metadata.channel_id == []
+    assert metadata.channel_names == []
+    assert (metadata.mpp_x, metadata.mpp_y, metadata.mpp_z) == (None, None, None)
+    assert metadata.objective_name is None
+    assert metadata.objective_nominal_magnification is None
+
+
+def test_czi_channel_names_parser_fallback() -> None:
+    """Missing or empty channel names fall back to the channel index"""
+    channels = [
+        {"@Id": "Channel:0", "@Name": "DAPI"},
+        {"@Id": "Channel:1", "@Name": ""},
+        {"@Id": "Channel:2", "@Name": None},
+        {"@Id": "Channel:3"},
+    ]
+    metadata = CZIImageMetadata(
+        metadata={
+            "ImageDocument": {
+                "Metadata": {"Information": {"Image": {"Dimensions": {"Channels": {"Channel": channels}}}}}
+            }
+        }
+    )
+
+    assert metadata.channel_id == [0, 1, 2, 3]
+    assert metadata.channel_names == ["DAPI", "1", "2", "3"]
+
+
+@pytest.fixture(scope="module", params=OPENSLIDE_GROUND_TRUTH.keys())
 def openslide_metadata_parser(request) -> BaseModel:
     path = request.param
     return (OpenslideImageMetadata.from_file(path), OPENSLIDE_GROUND_TRUTH[path])
@@ -166,6 +242,36 @@ def test_czi_read_metadata(path, ground_truth):
     assert all(metadata[k] == ground_truth[k] for k in metadata.keys())
 
 
+def test_czi_read_metadata_is_not_shared(tmp_path) -> None:
+    """Modifications of returned raw metadata must not affect later reads of the same file"""
+    path = str(tmp_path / "image.czi")
+    with pyczi.create_czi(path, exist_ok=True) as czi:
+        czi.write(data=np.zeros((8, 8, 1), dtype=np.uint8), plane={"C": 0})
+        czi.write_metadata(channel_names={0: "DAPI"}, scale_x=1e-7, scale_y=1e-7)
+
+    raw_metadata = read_metadata(path, image_type="czi", parse_metadata=False)
+    raw_metadata["ImageDocument"]["Metadata"]["Scaling"]["Items"]["Distance"][0]["Value"] = "5.0"
+
+    assert read_metadata(path, image_type="czi", parse_metadata=True)["mpp_x"] == 1e-7
+
+
+def test_czi_read_metadata_cache_relative_path(tmp_path, monkeypatch) -> None:
+    """Same relative path in different working directories refers to different files"""
+    for channel_name, directory in (("DAPI", "a"), ("GFP", "b")):
+        (tmp_path / directory).mkdir()
+        with pyczi.create_czi(str(tmp_path / directory / "image.czi"), exist_ok=True) as czi:
+            czi.write(data=np.zeros((8, 8, 1), dtype=np.uint8), plane={"C": 0})
+            czi.write_metadata(channel_names={0: channel_name}, scale_x=1e-7, scale_y=1e-7)
+        # Identical modification times, i.e. only the path distinguishes the files
+        os.utime(tmp_path / directory / "image.czi", ns=(0, 0))
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert read_metadata("image.czi", image_type="czi", parse_metadata=True)["channel_names"] == ["DAPI"]
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert read_metadata("image.czi", image_type="czi", parse_metadata=True)["channel_names"] == ["GFP"]
+
+
 @pytest.mark.skip("Skip due to error that only occurs in tests")
 @pytest.mark.parametrize(["path", "ground_truth"], ((k, v) for k, v in OPENSLIDE_GROUND_TRUTH.items()))
 def test_openslide_read_metadata(path, ground_truth):
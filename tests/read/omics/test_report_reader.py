@@ -116,10 +116,11 @@ def test_parse_pandas_multi_index(multi_index, set_index: str | None, shape: tup
 def test_parse_df(
     df, obs_index: str | None, var_index: str | None, obs_shape: tuple[int], var_shape: tuple[int]
 ) -> None:
-    df = df.copy(deep=True)
+    df_original = df.copy()
     adata = parse_df(df, obs_index=obs_index, var_index=var_index)
 
     TableModel().validate(adata)
+    pd.testing.assert_frame_equal(df, df_original)
 
     assert adata.shape == df.shape
     assert adata.obs.shape[1] == obs_shape
@@ -132,12 +133,13 @@ def test_parse_df(
 def test_parse_df_int_index(
     df_int, obs_index: str | None, var_index: str | None, obs_shape: tuple[int], var_shape: tuple[int]
 ) -> None:
-    df = df_int.copy(deep=True)
-    adata = parse_df(df, obs_index=obs_index, var_index=var_index)
+    df_original = df_int.copy()
+    adata = parse_df(df_int, obs_index=obs_index, var_index=var_index)
 
     TableModel().validate(adata)
+    pd.testing.assert_frame_equal(df_int, df_original)
 
-    assert adata.shape == df.shape
+    assert adata.shape == df_int.shape
     assert adata.obs.shape[1] == obs_shape
     assert adata.var.shape[1] == var_shape
     assert adata.obs.index.name == obs_index
@@ -148,12 +150,13 @@ def test_parse_df_int_index(
 def test_parse_df_multi_index(
     df_complex, obs_index: str | None, var_index: str | None, obs_shape: tuple[int], var_shape: tuple[int]
 ) -> None:
-    df = df_complex.copy(deep=True)
-    adata = parse_df(df, obs_index=obs_index, var_index=var_index)
+    df_original = df_complex.copy()
+    adata = parse_df(df_complex, obs_index=obs_index, var_index=var_index)
 
     TableModel().validate(adata)
+    pd.testing.assert_frame_equal(df_complex, df_original)
 
-    assert adata.shape == df.shape
+    assert adata.shape == df_complex.shape
     assert adata.obs.shape[1] == obs_shape
     assert adata.var.shape[1] == var_shape
     assert adata.obs.index.name == obs_index
@@ -171,7 +174,7 @@ def test_parse_df_table_kwargs(
     df, obs_index: str | None, var_index: str | None, obs_shape: int, var_shape: int
 ) -> None:
     """Test whether matching shapes attributes works"""
-    df = df.copy(deep=True)
+    df = df.copy(deep=False)
     df["region_key"] = "region1"
     df.set_index("region_key", append=True, inplace=True)
 
@@ -1,10 +1,14 @@
 import numpy as np
 import pytest
+import shapely
 from numpy.typing import NDArray
+from spatialdata.models import PointsModel
 
 from dvpio.read.shapes.geometry import (
     apply_transformation,
     compute_transformation,
+    points_to_numpy,
+    transform_geometries,
 )
 
 test_cases = [
@@ -91,3 +95,23 @@ def test_apply_transformation(
 ) -> None:
     target = apply_transformation(query, affine_transformation)
     assert np.isclose(target, reference, rtol=0.001).all()
+
+
+@pytest.mark.parametrize(["query", "reference", "affine_transformation"], test_cases)
+def test_transform_geometries(
+    query: NDArray[np.float64],
+    reference: NDArray[np.float64],
+    affine_transformation: NDArray[np.float64],
+) -> None:
+    geometries = np.array([shapely.Polygon(query), shapely.Polygon(query[::-1])])
+
+    transformed_geometries = transform_geometries(geometries, affine_transformation)
+
+    assert np.isclose(shapely.get_coordinates(transformed_geometries[0])[:-1], reference).all()
+    assert np.isclose(shapely.get_coordinates(transformed_geometries[1])[:-1], reference[::-1]).all()
+
+
+def test_points_to_numpy() -> None:
+    points = np.array([[0, 1], [2, 3], [4, 5]])
+
+    assert np.array_equal(points_to_numpy(PointsModel.parse(points)), points)
@@ -1,18 +1,22 @@
+import os
+
 import geopandas as gpd
+import lmd.lib as pylmd
 import numpy as np
 import pytest
+import shapely
 from numpy.typing import NDArray
 from scipy.optimize import linear_sum_assignment as lsa
 from scipy.spatial.distance import cdist
 from shapely import Polygon
 from spatialdata.models import PointsModel, ShapesModel
-from spatialdata.transformations import BaseTransformation
+from spatialdata.transformations import BaseTransformation, get_transformation
 
 from dvpio.read.shapes import read_lmd, transform_shapes
 
 
 def _get_centroid_xy(geometry: gpd.GeoSeries) -> NDArray[np.float64]:
-    return np.array(geometry.apply(lambda geom: [geom.centroid.x, geom.centroid.y]).tolist())
+    return shapely.get_coordinates(shapely.centroid(geometry.to_numpy()))
 
 
 calibration_points_image = PointsModel.parse(np.array([[15, 1015], [15, 205], [1015, 15]]))
@@ -33,6 +37,55 @@ def test_transform_shapes() -> None:
     assert len(transformed_shapes) == len(shapes)
 
 
+@pytest.mark.parametrize(
+    ["calibration_points_source", "calibration_points_target"],
+    [
+        [np.array([[0, 0], [1, 0]]), np.array([[0, 0], [1, 0]])],
+        [np.array([[0, 0], [1, 0], [0, 1]]), np.array([[0, 0], [1, 0], [0, 1], [1, 1]])],
+    ],
+)
+def test_transform_shapes_invalid_calibration_points(
+    calibration_points_source: NDArray[np.float64], calibration_points_target: NDArray[np.float64]
+) -> None:
+    shapes = ShapesModel.parse(gpd.GeoDataFrame(geometry=[Polygon([[0, 0], [1, 1], [0, 1]])]))
+
+    with pytest.raises(ValueError):
+        transform_shapes(
+            shapes=shapes,
+            calibration_points_source=PointsModel.parse(calibration_points_source),
+            calibration_points_target=PointsModel.parse(calibration_points_target),
+        )
+
+
+def test_transform_shapes_switch_orientation() -> None:
+    calibration_points_source = PointsModel.parse(np.array([[0, 0], [1, 0], [0, 1]]))
+    calibration_points_target = PointsModel.parse(np.array([[1, 1], [3, 1], [1, 3]]))
+    shapes = ShapesModel.parse(gpd.GeoDataFrame(geometry=[Polygon([[0, 0], [1, 1], [0, 1]])] * 2))
+
+    transformed_shapes = transform_shapes(
+        shapes=shapes,
+        calibration_points_source=calibration_points_source,
+        calibration_points_target=calibration_points_target,
+    )
+    switched_shapes = transform_shapes(
+        shapes=shapes,
+        calibration_points_source=calibration_points_source,
+        calibration_points_target=calibration_points_target,
+        switch_orientation=True,
+    )
+
+    assert np.allclose(
+        shapely.get_coordinates(switched_shapes["geometry"]),
+        shapely.get_coordinates(transformed_shapes["geometry"])[:, ::-1],
+    )
+
+    # Transformation to LMD coordinate system reverts the switch
+    to_lmd = get_transformation(switched_shapes, to_coordinate_system="to_lmd").to_affine_matrix(("x", "y"), ("x", "y"))
+    switched_coordinates = shapely.get_coordinates(switched_shapes["geometry"])
+    lmd_coordinates = switched_coordinates @ to_lmd[:2, :2].T + to_lmd[:2, 2]
+    assert np.allclose(lmd_coordinates, shapely.get_coordinates(shapes["geometry"]))
+
+
 @pytest.mark.parametrize(
     ["path", "calibration_points", "ground_truth_path"],
     [
@@ -47,7 +100,7 @@ def test_read_lmd(path: str, calibration_points: NDArray[np.float64], ground_tru
     lmd_shapes = read_lmd(path, calibration_points, switch_orientation=False, precision=3)
     lmd_centroids = _get_centroid_xy(lmd_shapes["geometry"])
 
-    ground_truth = gpd.read_file(ground_truth_path)
+    ground_truth = gpd.read_file(ground_truth_path, engine="pyogrio")
     ground_truth_centroids = _get_centroid_xy(ground_truth["geometry"])
 
     distances = cdist(lmd_centroids, ground_truth_centroids)
@@ -74,3 +127,48 @@ def test_read_lmd_transformation(path: str, calibration_points: NDArray[np.float
 
     assert "to_lmd" in lmd_shapes.attrs.get("transform")
     assert isinstance(lmd_shapes.attrs.get("transform").get("to_lmd"), BaseTransformation)
+
+
+def test_read_lmd_cache(tmp_path) -> None:
+    path = str(tmp_path / "shapes.xml")
+    calibration_points_lmd = np.array([[0, 0], [0, 1000], [1000, 1000]])
+
+    collection = pylmd.Collection(calibration_points=calibration_points_lmd)
+    collection.new_shape(np.array([[0, 0], [10, 0], [10, 10], [0, 0]]), well="A1", name="cell_1")
+    collection.save(path)
+
+    lmd_shapes = read_lmd(path, calibration_points_image)
+    calibration_points_read = lmd_shapes.attrs["lmd_calibration_points"].copy()
+    # Modifications of the returned object do not affect the cache
+    lmd_shapes.attrs["lmd_calibration_points"][:] = 0
+    lmd_shapes_cached = read_lmd(path, calibration_points_image)
+
+    assert lmd_shapes_cached.geom_equals(lmd_shapes["geometry"]).all()
+    assert (lmd_shapes_cached.attrs["lmd_calibration_points"] == calibration_points_read).all()
+
+    # Cache is invalidated when the file changes
+    collection.new_shape(np.array([[20, 20], [30, 20], [30, 30], [20, 20]]), well="A2", name="cell_2")
+    collection.save(path)
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1_000_000_000))
+
+    assert len(read_lmd(path, calibration_points_image)) == 2
+
+
+def test_read_lmd_cache_relative_path(tmp_path, monkeypatch) -> None:
+    """Same relative path in different working directories refers to different files"""
+    calibration_points_lmd = np.array([[0, 0], [0, 1000], [1000, 1000]])
+
+    for n_shapes, directory in enumerate(["a", "b"], start=1):
+        (tmp_path / directory).mkdir()
+        collection = pylmd.Collection(calibration_points=calibration_points_lmd)
+        for idx in range(n_shapes):
+            collection.new_shape(np.array([[0, 0], [10, 0], [10, 10], [0, 0]]) + 20 * idx, well="A1")
+        collection.save(str(tmp_path / directory / "shapes.xml"))
+        # Identical modification times, i.e. only the path distinguishes the files
+        os.utime(tmp_path / directory / "shapes.xml", ns=(0, 0))
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert len(read_lmd("shapes.xml", calibration_points_image)) == 1
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert len(read_lmd("shapes.xml", calibration_points_image)) == 2
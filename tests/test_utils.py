@@ -1,6 +1,16 @@
+import os
+import warnings
+
 import pytest
 
-from dvpio._utils import deprecated_docs, deprecated_log, experimental_docs, experimental_log, is_parsed
+from dvpio._utils import (
+    deprecated_docs,
+    deprecated_log,
+    experimental_docs,
+    experimental_log,
+    file_cache,
+    is_parsed,
+)
 
 
 @pytest.fixture()
@@ -31,6 +41,17 @@ def test_experimental_log(function_factory):
         sample_func()
 
 
+def test_experimental_log_warns_once(function_factory):
+    sample_func = experimental_log(function_factory)
+
+    with pytest.warns(UserWarning, match="is experimental and may change"):
+        sample_func()
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        sample_func()
+
+
 def test_deprecated_docs(function_factory):
     sample_func = deprecated_docs(function_factory)
 
@@ -102,3 +123,33 @@ def test_deprecated_log_warning_category():
 
     with pytest.warns(DeprecationWarning):
         decorated_func()
+
+
+def test_file_cache(tmp_path, monkeypatch):
+    """Test that file_cache re-reads a file only if its absolute path or modification time changes."""
+    calls = []
+
+    @file_cache(maxsize=4)
+    def read(path):
+        calls.append(path)
+        with open(path) as f:
+            return f.read()
+
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "file.txt").write_text(directory)
+        os.utime(tmp_path / directory / "file.txt", ns=(0, 0))
+
+    monkeypatch.chdir(tmp_path / "a")
+    assert read("file.txt") == "a"
+    assert read(tmp_path / "a" / "file.txt") == "a"
+    assert len(calls) == 1
+
+    monkeypatch.chdir(tmp_path / "b")
+    assert read("file.txt") == "b"
+    assert len(calls) == 2
+
+    (tmp_path / "b" / "file.txt").write_text("c")
+    os.utime(tmp_path / "b" / "file.txt", ns=(1, 1))
+    assert read("file.txt") == "c"
+    assert len(calls) == 3
@@ -1,16 +1,17 @@
 import os
-from tempfile import mkdtemp
 
+import geopandas as gpd
 import lmd.lib as pylmd
 import numpy as np
 import pytest
+import shapely
 from spatialdata.models import PointsModel, ShapesModel
 
 from dvpio.read.shapes import read_lmd
 from dvpio.write import write_lmd
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dummy_data() -> tuple[ShapesModel, PointsModel]:
     """Example data - calibration points and triangular shapes"""
     calibration_points_image = PointsModel.parse(np.array([[0, 2], [2, 2], [2, 0]]))
@@ -101,12 +102,13 @@ def test_write_custom_attributes(
     ],
 )
 def test_write_lmd_overwrite(
+    tmp_path,
     dummy_data,
     annotation_name_column: str | None,
     annotation_well_column: str | None,
 ) -> None:
     """Test repeated overwriting of xml output"""
-    path = os.path.join(mkdtemp(), "test.xml")
+    path = tmp_path / "test.xml"
     gdf, calibration_points = dummy_data
 
     write_lmd(
@@ -141,6 +143,24 @@ def test_write_lmd_overwrite(
         )
 
 
+def test_write_lmd_multipolygon(tmp_path) -> None:
+    """Geometries other than polygons are rejected with the offending rows"""
+    polygon = shapely.Polygon([[0, 0], [0, 1], [1, 0], [0, 0]])
+    multipolygon = shapely.MultiPolygon([polygon, shapely.Polygon([[2, 2], [2, 3], [3, 2], [2, 2]])])
+    annotation = ShapesModel.parse(gpd.GeoDataFrame(geometry=[polygon, multipolygon, polygon]))
+    calibration_points = PointsModel.parse(np.array([[0, 0], [1, 1], [0, 1]]))
+
+    with pytest.raises(ValueError, match=r"rows \[1\]"):
+        write_lmd(
+            tmp_path / "test.xml",
+            annotation=annotation,
+            calibration_points=calibration_points,
+            affine_transformation=np.eye(3),
+        )
+
+    assert not os.path.exists(tmp_path / "test.xml")
+
+
 @pytest.mark.parametrize(
     ("read_path",),
     [("./data/triangles/collection.xml",)],
@@ -166,3 +186,33 @@ def test_read_write_lmd(tmp_path, dummy_data, read_path):
     query = query.to_geopandas()
 
     assert query.equals(ref)
+
+
+@pytest.mark.parametrize("switch_orientation", [False, True])
+def test_read_write_lmd_switch_orientation(tmp_path, switch_orientation: bool) -> None:
+    """Shapes read with read_lmd are written back to their original LMD coordinates"""
+    calibration_points_lmd = np.array([[0, 0], [0, 1000], [1000, 1000]])
+    collection = pylmd.Collection(calibration_points=calibration_points_lmd, scale=1)
+    collection.new_shape(np.array([[100, 200], [300, 200], [300, 500], [100, 200]]), well="A1")
+    collection.new_shape(np.array([[600, 100], [700, 150], [650, 300], [600, 100]]), well="A2")
+    collection.save(tmp_path / "ref.xml")
+
+    calibration_points_image = calibration_points_lmd * 0.25 + np.array([5, 7])
+    gdf = read_lmd(
+        tmp_path / "ref.xml",
+        calibration_points_image=PointsModel.parse(calibration_points_image),
+        switch_orientation=switch_orientation,
+    )
+
+    # Calibration points in the coordinate system of the read shapes
+    if switch_orientation:
+        calibration_points_image = calibration_points_image[:, ::-1]
+    write_lmd(tmp_path / "query.xml", annotation=gdf, calibration_points=PointsModel.parse(calibration_points_image))
+
+    ref = pylmd.Collection()
+    ref.load(tmp_path / "ref.xml")
+    query = pylmd.Collection()
+    query.load(tmp_path / "query.xml")
+
+    assert np.array_equal(query.calibration_points, ref.calibration_points)
+    assert query.to_geopandas().equals(ref.to_geopandas())